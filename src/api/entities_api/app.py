@@ -1,11 +1,15 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from projectdavid_common import UtilsInterface
 from sqlalchemy import text
 
 from src.api.entities_api.db.database import engine, wait_for_databases
 from src.api.entities_api.models.models import Base
 from src.api.entities_api.observability.tracing import setup_tracing
+from src.api.entities_api.orchestration.mixins.web_search_mixin import get_searxng_client
 from src.api.entities_api.routers import api_router
 
 logging_utility = UtilsInterface.LoggingUtility()
@@ -13,6 +17,12 @@ logging_utility = UtilsInterface.LoggingUtility()
 wait_for_databases()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await get_searxng_client().aclose()
+
+
 def create_app(init_db: bool = True) -> FastAPI:
     logging_utility.info("Creating FastAPI app")
 
@@ -23,6 +33,8 @@ def create_app(init_db: bool = True) -> FastAPI:
         docs_url="/mydocs",
         redoc_url="/altredoc",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # 🧠 OTel MUST be initialised before router binding
@@ -1,8 +1,11 @@
 import json
 from typing import Dict, List, Optional
 
+from projectdavid_common.utilities.logging_service import LoggingUtility
 from redis.asyncio import Redis
 
+LOG = LoggingUtility()
+
 
 class InventoryCache:
     """
@@ -36,6 +39,13 @@ class InventoryCache:
         """
         return f"net_eng:usr:{user_id}:inv:*"
 
+    async def _tenant_keys(self, user_id: str) -> List:
+        """
+        Collects every inventory key for this User with SCAN.
+        Not atomic: keys written while the scan runs may be missed.
+        """
+        return [key async for key in self.redis.scan_iter(match=self._tenant_pattern(user_id))]
+
     # --- PUBLIC METHODS ---
 
     async def clear_inventory(self, user_id: str) -> int:
@@ -43,11 +53,7 @@ class InventoryCache:
         Wipes all inventory data (devices and groups) for a specific user.
         Returns the number of Redis keys deleted.
         """
-        pattern = self._tenant_pattern(user_id)
-        keys_to_delete = []
-
-        async for key in self.redis.scan_iter(match=pattern):
-            keys_to_delete.append(key)
+        keys_to_delete = await self._tenant_keys(user_id)
 
         if keys_to_delete:
             await self.redis.delete(*keys_to_delete)
@@ -55,12 +61,33 @@ class InventoryCache:
 
         return 0
 
-    async def ingest_inventory(self, user_id: str, devices: List[Dict]) -> int:
+    async def ingest_inventory(
+        self, user_id: str, devices: List[Dict], clear_existing: bool = False
+    ) -> int:
         """
         Stores network devices into the specific User's namespace.
+
+        Group memberships are collected up front so each group set gets a single
+        SADD/EXPIRE, and all writes (including the optional wipe of the previous
+        inventory) go out in one MULTI/EXEC round trip. The keys to wipe are found
+        by a SCAN before the MULTI, so the wipe is not atomic with the writes: keys
+        another ingest adds after the scan are not deleted.
         """
+        valid_devices = [d for d in devices if d.get("host_name")]
+        dropped = len(devices) - len(valid_devices)
+        if dropped:
+            LOG.warning(f"Skipped {dropped} devices missing 'host_name' (User {user_id})")
+
+        stale_keys = await self._tenant_keys(user_id) if clear_existing else []
+
+        all_hosts: List[str] = []
+        group_members: Dict[str, List[str]] = {}
+
         async with self.redis.pipeline() as pipe:
-            for dev in devices:
+            if stale_keys:
+                await pipe.delete(*stale_keys)
+
+            for dev in valid_devices:
                 hostname = dev["host_name"]
 
                 # 1. Store Device Data (Scoped to User)
@@ -69,21 +96,25 @@ class InventoryCache:
 
                 await pipe.set(dev_key, json.dumps(dev), ex=self.ttl)
 
-                # 2. Update Group Indexes (Scoped to User)
+                # 2. Collect Group Indexes (Scoped to User)
                 if "groups" in dev and isinstance(dev["groups"], list):
                     for group in dev["groups"]:
-                        g_key = self._group_key(user_id, group)
-                        await pipe.sadd(g_key, hostname)
-                        await pipe.expire(g_key, self.ttl)
+                        group_members.setdefault(group, []).append(hostname)
 
                 # 3. Always add to 'all' group for this scope
-                all_key = self._group_key(user_id, "all")
-                await pipe.sadd(all_key, hostname)
-                await pipe.expire(all_key, self.ttl)
+                all_hosts.append(hostname)
+
+            if all_hosts:
+                group_members.setdefault("all", []).extend(all_hosts)
+
+            for group, hosts in group_members.items():
+                g_key = self._group_key(user_id, group)
+                await pipe.sadd(g_key, *hosts)
+                await pipe.expire(g_key, self.ttl)
 
             await pipe.execute()
 
-        return len(devices)
+        return len(valid_devices)
 
     async def search_by_group(self, user_id: str, group: str) -> List[Dict]:
         """
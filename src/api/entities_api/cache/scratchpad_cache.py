@@ -19,6 +19,25 @@ except ImportError:
 # 86400 = 24 Hours. Enough for a user to come back the next day.
 REDIS_SCRATCHPAD_TTL = int(os.getenv("REDIS_SCRATCHPAD_TTL_SECONDS", "86400"))
 
+# Server-side read-modify-write for appends: one round trip, and no lost
+# updates if two writers append to the same notebook at once.
+# KEYS[1] = notebook key, ARGV = (note, last_updated, ttl)
+_APPEND_LUA = """
+local raw = redis.call('GET', KEYS[1])
+local existing = ''
+if raw then
+    local ok, data = pcall(cjson.decode, raw)
+    if ok and type(data) == 'table' and type(data['content']) == 'string' then
+        existing = data['content']
+    end
+end
+local joined = existing .. '\\n\\n' .. ARGV[1]
+local updated = joined:match('^()%s*$') and '' or joined:match('^%s*(.*%S)')
+local payload = cjson.encode({content = updated, last_updated = tonumber(ARGV[2])})
+redis.call('SET', KEYS[1], payload, 'EX', ARGV[3])
+return 1
+"""
+
 
 class ScratchpadCache:
     """
@@ -29,6 +48,9 @@ class ScratchpadCache:
 
     def __init__(self, redis: Union[SyncRedis, "AsyncRedis"]):
         self.redis = redis
+        # Registered once; calls go out as EVALSHA and fall back to EVAL
+        # only if the server's script cache was flushed.
+        self._append_script = redis.register_script(_APPEND_LUA)
 
     def _cache_key(self, thread_id: str) -> str:
         """
@@ -72,18 +94,15 @@ class ScratchpadCache:
         """
         Atomic append operation.
         Used when the agent just wants to jot down a finding without reading everything first.
+        Runs as a single Lua script so the GET -> MODIFY -> SET happens inside Redis.
         """
-        # Note: To be truly atomic in Redis, we'd need a LUA script,
-        # but for an LLM agent, a GET -> MODIFY -> SET cycle is usually acceptable
-        # as the agent is single-threaded per run.
-
-        current_data = await self.get_scratchpad(thread_id)
-        existing_content = current_data.get("content", "")
-
-        # Add a clear separator
-        updated_content = f"{existing_content}\n\n{new_notes}".strip()
+        keys = [self._cache_key(thread_id)]
+        args = [new_notes, time.time(), REDIS_SCRATCHPAD_TTL]
 
-        await self.overwrite_scratchpad(thread_id, updated_content)
+        if isinstance(self.redis, AsyncRedis):
+            await self._append_script(keys=keys, args=args)
+        else:
+            await asyncio.to_thread(self._append_script, keys=keys, args=args)
 
     async def clear_scratchpad(self, thread_id: str):
         """Deletes the notebook (e.g., when starting a totally new topic)."""
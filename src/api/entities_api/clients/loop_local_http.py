@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any, AsyncGenerator, Dict, Tuple
+
+import httpx
+
+
+class LoopLocalHttpClient:
+    """
+    One pooled httpx.AsyncClient per event loop.
+
+    The API serves requests on the app loop, but orchestration workers run
+    each stream on a fresh loop in a thread. An AsyncClient is bound to the
+    loop it first used, so each loop gets its own, and that client is closed
+    when the loop runs shutdown_asyncgens() (asyncio.run and every worker
+    base do). Entries for loops closed without that step are pruned lazily.
+    """
+
+    def __init__(self, **client_kwargs: Any):
+        self._client_kwargs = client_kwargs
+        # loop -> (client, parked closer generator that owns its shutdown)
+        self._clients: Dict[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, Any]] = {}
+
+    async def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(loop)
+        if entry is not None and not entry[0].is_closed:
+            return entry[0]
+
+        self._prune()
+        client = httpx.AsyncClient(**self._client_kwargs)
+        closer = self._close_with_loop(loop, client)
+        # Registered before the first await so concurrent callers share it.
+        self._clients[loop] = (client, closer)
+        # Starting the generator registers it with the loop's asyncgen hooks;
+        # it stays parked until shutdown_asyncgens() closes it.
+        await closer.__anext__()
+        return client
+
+    async def aclose(self) -> None:
+        """Close the client belonging to the running loop, if any."""
+        entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            # Finishing the parked closer closes the client.
+            await entry[1].aclose()
+
+    async def _close_with_loop(
+        self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+    ) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            if self._clients.get(loop, (None,))[0] is client:
+                del self._clients[loop]
+            await client.aclose()
+
+    def _prune(self) -> None:
+        for loop in [lp for lp in self._clients if lp.is_closed()]:
+            del self._clients[loop]
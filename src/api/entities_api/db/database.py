@@ -14,6 +14,9 @@ logging_utility = UtilsInterface.LoggingUtility()
 DATABASE_URL = os.getenv("DATABASE_URL")
 SPECIAL_DB_URL = os.getenv("SPECIAL_DB_URL")
 
+# Statement echo logs every SQL round trip; keep it opt-in for debugging.
+DB_ECHO = os.getenv("DB_ECHO", "0") in ("1", "true", "True")
+
 
 # Container-aware resolver logic is kept with the engine definitions
 def running_in_docker() -> bool:
@@ -31,22 +34,24 @@ SPECIAL_DB_RUNTIME_URL = resolve_special_db_runtime_url(SPECIAL_DB_URL)
 # 1. The ONE configured main engine for the entire application
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
+    echo=DB_ECHO,
     pool_size=20,
     max_overflow=40,
     pool_timeout=30,
     pool_recycle=280,
+    pool_pre_ping=True,
 )
 
 # The separate, special-purpose engine
 special_engine = (
     create_engine(
         SPECIAL_DB_RUNTIME_URL,
-        echo=True,
+        echo=DB_ECHO,
         pool_size=10,
         max_overflow=20,
         pool_timeout=30,
         pool_recycle=280,
+        pool_pre_ping=True,
     )
     if SPECIAL_DB_RUNTIME_URL
     else None
@@ -5,13 +5,18 @@ import json
 import os
 import re
 from collections import defaultdict
+from functools import lru_cache
+from heapq import nlargest
 from typing import Any, AsyncGenerator, Dict, List, Optional
+from urllib.parse import urlsplit
 
 import httpx
 from projectdavid_common import ToolValidator
 from projectdavid_common.utilities.logging_service import LoggingUtility
 from projectdavid_common.validation import StatusEnum
 
+from src.api.entities_api.clients.loop_local_http import LoopLocalHttpClient
+
 LOG = LoggingUtility()
 
 # Hard cap on scroll_web_page calls per URL per research session.
@@ -22,6 +27,7 @@ SCROLL_LIMIT_PER_URL = 3
 # Internal SearxNG container URL — direct, no SDK round-trip needed.
 SEARXNG_BASE_URL = os.getenv("SEARXNG_URL", "http://searxng:8080")
 SEARXNG_TIMEOUT = int(os.getenv("SEARXNG_TIMEOUT", "15"))
+SEARXNG_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
 
 
 def _status(run_id: str, tool: str, message: str, status: str = "running") -> str:
@@ -63,13 +69,31 @@ class SearxNGResult:
         self.url: str = data.get("url", "")
         self.snippet: str = data.get("content", "")
         self.engine: str = data.get("engine", "unknown")
+        self.score: float = _score(data)
 
-        # FIX: Safely handle null/None or string scores from SearxNG
-        raw_score = data.get("score")
-        try:
-            self.score: float = float(raw_score) if raw_score is not None else 0.0
-        except (ValueError, TypeError):
-            self.score = 0.0
+
+def _score(data: Dict[str, Any]) -> float:
+    # FIX: Safely handle null/None or string scores from SearxNG
+    raw_score = data.get("score")
+    try:
+        return float(raw_score) if raw_score is not None else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+_ENCYCLOPEDIA_HOST = "wikipedia.org"
+_AUTHORITY_LABELS = frozenset({"gov", "edu", "org"})
+
+
+def _authority_tag(url: str) -> str:
+    """Classify a result by its host only, not by substrings anywhere in the URL."""
+    host = (urlsplit(url).hostname or "").rstrip(".")
+    if host == _ENCYCLOPEDIA_HOST or host.endswith("." + _ENCYCLOPEDIA_HOST):
+        return " [ENCYCLOPEDIA]"
+    # Any label after the first, so both example.gov and example.gov.uk count.
+    if not _AUTHORITY_LABELS.isdisjoint(host.split(".")[1:]):
+        return " [HIGH AUTHORITY]"
+    return ""
 
 
 class SearxNGClient:
@@ -79,6 +103,9 @@ class SearxNGClient:
     Calls http://searxng:8080 directly — no SDK round-trip, no browser
     overhead. The browserless container is reserved for page *reading*,
     not discovery.
+
+    Keep-alive connections are pooled per event loop (see LoopLocalHttpClient),
+    so the app loop and each worker-thread loop reuse their own connections.
     """
 
     def __init__(
@@ -88,6 +115,11 @@ class SearxNGClient:
     ):
         self.base_url = base_url
         self.timeout = timeout
+        self._http = LoopLocalHttpClient(timeout=timeout, limits=SEARXNG_LIMITS)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client of the current loop."""
+        await self._http.aclose()
 
     async def search(
         self,
@@ -123,10 +155,10 @@ class SearxNGClient:
         LOG.info(f"🔎 SearxNG query: '{query}' | engines={engines or 'default'}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.get(f"{self.base_url}/search", params=params)
-                resp.raise_for_status()
-                data = resp.json()
+            http = await self._http.get()
+            resp = await http.get(f"{self.base_url}/search", params=params)
+            resp.raise_for_status()
+            data = resp.json()
         except httpx.HTTPStatusError as exc:
             LOG.error(f"SearxNG HTTP error: {exc}")
             raise RuntimeError(f"SearxNG returned {exc.response.status_code}")
@@ -135,13 +167,11 @@ class SearxNGClient:
             raise RuntimeError(f"Could not reach SearxNG at {self.base_url}: {exc}")
 
         raw = data.get("results", [])
-        results = sorted(
-            [SearxNGResult(r) for r in raw],
-            key=lambda r: r.score,
-            reverse=True,
-        )
-        LOG.info(f"✅ SearxNG returned {len(results)} results for '{query}'")
-        return results[:count]
+        # Partial-rank the raw dicts, best first, so only the kept results are
+        # wrapped. nlargest is stable, so ties keep SearxNG's order.
+        ranked = nlargest(count, raw, key=_score)
+        LOG.info(f"✅ SearxNG returned {len(raw)} results for '{query}'")
+        return [SearxNGResult(r) for r in ranked]
 
     async def format_for_agent(
         self,
@@ -177,14 +207,8 @@ class SearxNGClient:
         ]
 
         for i, r in enumerate(results, 1):
-            authority_tag = ""
-            if any(d in r.url for d in [".gov", ".edu", ".org"]):
-                authority_tag = " [HIGH AUTHORITY]"
-            elif "wikipedia.org" in r.url:
-                authority_tag = " [ENCYCLOPEDIA]"
-
             lines.append(
-                f"{i}. **{r.title}**{authority_tag}  [via {r.engine}]\n"
+                f"{i}. **{r.title}**{_authority_tag(r.url)}  [via {r.engine}]\n"
                 f"   URL: {r.url}\n"
                 f"   {r.snippet}\n"
             )
@@ -200,6 +224,12 @@ class SearxNGClient:
         return "\n".join(lines)
 
 
+@lru_cache(maxsize=1)
+def get_searxng_client() -> SearxNGClient:
+    """Process-wide SearxNGClient shared by the tools router and the web search mixin."""
+    return SearxNGClient()
+
+
 # ---------------------------------------------------------------------------
 # Mixin
 # ---------------------------------------------------------------------------
@@ -716,7 +746,7 @@ class WebSearchMixin:
                 session["search_performed"] = True
                 query_tier = session.get("query_tier", 1)
 
-                searxng = SearxNGClient()
+                searxng = get_searxng_client()
                 yield _status(run_id, tool_name, "Parsing search results...")
 
                 raw_content = await searxng.format_for_agent(
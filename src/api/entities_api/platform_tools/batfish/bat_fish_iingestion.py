@@ -1,26 +1,117 @@
+import hashlib
+import os
 import re
 import shutil
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
 
 GNS3_ROOT = Path("/data/gns3")
 SNAPSHOT_ROOT = Path("/data/snapshots")
 
+STARTUP_CONFIG_SUFFIX = "startup-config.cfg"
 
-def extract_hostname(cfg_text: str) -> str:
-    match = re.search(r"^hostname\s+(\S+)", cfg_text, re.MULTILINE)
-    return match.group(1) if match else f"device_{uuid.uuid4().hex[:6]}"
+# Staging is pure disk I/O, so oversubscribe the CPU count.
+STAGE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# The hostname line sits at the top of IOS-style configs; scan only the head.
+HOSTNAME_SCAN_BYTES = 8192
+_HOSTNAME_BYTES_RE = re.compile(rb"^hostname\s+(\S+)", re.MULTILINE)
+
+
+def _iter_config_files(root: str) -> List[str]:
+    """
+    Single scandir walk for GNS3 startup configs, skipping hidden directories.
+    Other *.cfg files (e.g. *_private-config.cfg, which holds keys) are never staged.
+    """
+    configs: List[str] = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not name.startswith("."):
+                            stack.append(entry.path)
+                    elif name.endswith(STARTUP_CONFIG_SUFFIX) and entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        configs.append(entry.path)
+        except OSError:
+            continue
+    return configs
+
+
+def extract_hostname_from_file(cfg: str) -> Optional[str]:
+    """Match the hostname against the raw file head; read the rest only on a miss."""
+    with open(cfg, "rb") as fh:
+        head = fh.read(HOSTNAME_SCAN_BYTES)
+        match = _HOSTNAME_BYTES_RE.search(head)
+        # A match ending at the buffer edge may be a truncated name.
+        if match is None or match.end() == HOSTNAME_SCAN_BYTES:
+            match = _HOSTNAME_BYTES_RE.search(head + fh.read())
+    return match.group(1).decode("utf-8", "ignore") if match else None
+
+
+def _short_hash(cfg: str) -> str:
+    with open(cfg, "rb") as fh:
+        return hashlib.blake2b(fh.read(), digest_size=4).hexdigest()
+
+
+def _stage_copy(src: str, dst: Path) -> None:
+    """
+    Copy one config into the snapshot. copy_file_range keeps the copy inside the
+    kernel (and becomes a reflink on CoW filesystems such as XFS/Btrfs).
+    Hardlinks are deliberately not used: GNS3 rewrites startup configs in place,
+    which would silently change a snapshot that was already taken.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+def _resolve_names(candidates: List[str], hostnames: List[Optional[str]]) -> List[str]:
+    """
+    Pick a destination stem per config. The first config for a hostname keeps the
+    bare name; duplicates and configs without a hostname get a content-hash suffix,
+    so re-ingesting the same lab always produces the same file names.
+    """
+    used = set()
+    names: List[str] = []
+    for cfg, hostname in zip(candidates, hostnames):
+        if hostname is None:
+            name = f"device_{_short_hash(cfg)}"
+        elif hostname in used:
+            name = f"{hostname}_{_short_hash(cfg)}"
+        else:
+            name = hostname
+        used.add(name)
+        names.append(name)
+    return names
 
 
 def ingest_gns3_configs(snapshot_name: str):
     snapshot_path = SNAPSHOT_ROOT / snapshot_name / "configs"
     snapshot_path.mkdir(parents=True, exist_ok=True)
 
-    for cfg in GNS3_ROOT.rglob("*startup-config.cfg"):
-        text = cfg.read_text(errors="ignore")
-        hostname = extract_hostname(text)
-        dst = snapshot_path / f"{hostname}.cfg"
-        shutil.copy(cfg, dst)
+    candidates = sorted(_iter_config_files(str(GNS3_ROOT)))
+
+    with ThreadPoolExecutor(max_workers=STAGE_WORKERS) as pool:
+        hostnames = list(pool.map(extract_hostname_from_file, candidates))
+        names = _resolve_names(candidates, hostnames)
+        destinations = [snapshot_path / f"{name}.cfg" for name in names]
+        list(pool.map(_stage_copy, candidates, destinations))
 
     return snapshot_path
 
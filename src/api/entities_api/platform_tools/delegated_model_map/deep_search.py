@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 # ---------------------------------------------------------
 # 1. The Configuration Map
 # ---------------------------------------------------------
@@ -9,11 +11,20 @@
 # together-ai/Qwen/Qwen3-Coder-480B-A35B-Instruct-FP8
 # together-ai/openai/gpt-oss-120b
 
-DELEGATED_DEEP_SEARCH_MAP = {
-    "together-ai": "together-ai/Qwen/Qwen3-Next-80B-A3B-Instruct-FP8",
-    "hyperbolic": "hyperbolic/Qwen/Qwen3-Coder-480B-A35B-Instruct",
-    "fireworks": "fireworks/accounts/fireworks/models/deepseek-r1",
-    "openai": "openai/o1-preview",
-    "anthropic": "anthropic/claude-3-5-sonnet-20241022",
-    "default": "openai/gpt-4o",  # Fallback
-}
+# Read-only so callers cannot mutate the routing table at runtime.
+DELEGATED_DEEP_SEARCH_MAP = MappingProxyType(
+    {
+        "together-ai": "together-ai/Qwen/Qwen3-Next-80B-A3B-Instruct-FP8",
+        "hyperbolic": "hyperbolic/Qwen/Qwen3-Coder-480B-A35B-Instruct",
+        "fireworks": "fireworks/accounts/fireworks/models/deepseek-r1",
+        "openai": "openai/o1-preview",
+        "anthropic": "anthropic/claude-3-5-sonnet-20241022",
+        "default": "openai/gpt-4o",  # Fallback
+    }
+)
+_DEFAULT = DELEGATED_DEEP_SEARCH_MAP["default"]
+
+
+def resolve_deep_search(provider: str) -> str:
+    """Return the deep-search model for a provider, falling back to the default."""
+    return DELEGATED_DEEP_SEARCH_MAP.get(provider, _DEFAULT)
@@ -1,5 +1,5 @@
 from entities_api.platform_tools.delegated_model_map.deep_search import \
-    DELEGATED_DEEP_SEARCH_MAP
+    resolve_deep_search
 
 
 # ---------------------------------------------------------
@@ -12,7 +12,7 @@ def get_delegated_model(requested_model: str) -> str:
     """
     if not requested_model or "/" not in requested_model:
         print(f"  [Log] No provider prefix found in '{requested_model}'. Using default.")
-        return DELEGATED_DEEP_SEARCH_MAP["default"]
+        return resolve_deep_search("default")
 
     # Split ONLY on the first slash.
     # "together-ai/Qwen/Qwen..." -> ["together-ai", "Qwen/Qwen..."]
@@ -22,4 +22,4 @@ def get_delegated_model(requested_model: str) -> str:
     print(f"  [Log] Detected Provider: '{provider}'")
 
     # Return mapped model or fallback if provider is unknown
-    return DELEGATED_DEEP_SEARCH_MAP.get(provider, DELEGATED_DEEP_SEARCH_MAP["default"])
+    return resolve_deep_search(provider)
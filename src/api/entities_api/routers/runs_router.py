@@ -3,7 +3,7 @@ import asyncio
 import json
 from typing import Any, Dict, Literal, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
 from projectdavid_common import UtilsInterface, ValidationInterface
 from projectdavid_common.schemas.enums import StatusEnum
 from pydantic import ValidationError
@@ -26,13 +26,14 @@ router = APIRouter()
 @router.post("/runs", response_model=ValidationInterface.Run)
 def create_run(
     run: ValidationInterface.RunCreate,
+    db: Session = Depends(get_db),
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
     user_id = auth_key.user_id
     logging_utility.info("[%s] Creating run for thread %s", user_id, run.thread_id)
     run_service = RunService()
     try:
-        new_run = run_service.create_run(run, user_id=user_id)
+        new_run = run_service.create_run(run, user_id=user_id, db=db)
         logging_utility.info("Run created successfully: %s", new_run.id)
         return new_run
     except HTTPException as e:
@@ -49,14 +50,16 @@ def create_run(
 @router.get("/runs/{run_id}", response_model=ValidationInterface.RunReadDetailed)
 def retrieve_run(
     run_id: str,
+    db: Session = Depends(get_db),
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
     logging_utility.info(f"[{auth_key.user_id}] Retrieving run ID: {run_id}")
     run_service = RunService()
     try:
-        run = run_service.retrieve_run(run_id, user_id=auth_key.user_id)  # ← FIXED
+        run = run_service.retrieve_run(run_id, user_id=auth_key.user_id, db=db)
         logging_utility.info(f"Run retrieved successfully: {run_id}")
-        return run
+        # Built from a trusted row; skip response_model re-validation.
+        return Response(content=run.model_dump_json(), media_type="application/json")
     except HTTPException as e:
         logging_utility.error(f"HTTP error retrieving run {run_id}: {str(e)}")
         raise e
@@ -85,7 +88,7 @@ def update_run_status(
 
     run_service = RunService()
     try:
-        updated_run = run_service.update_run_status(run_id, status_update.status)
+        updated_run = run_service.update_run_status(run_id, status_update.status, db=db)
         logging_utility.info(f"Run status updated: {run_id}")
         return updated_run
     except ValidationError as e:
@@ -100,6 +103,7 @@ def update_run_status(
 def update_run_fields(
     run_id: str,
     payload: Dict[str, Any] = Body(...),
+    db: Session = Depends(get_db),
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
     """
@@ -121,9 +125,9 @@ def update_run_fields(
     )
     svc = RunService()
     try:
-        return svc.update_run_fields(  # ← FIXED: user_id now forwarded
-            run_id, user_id=auth_key.user_id, **payload
-        )
+        # user_id / db are keyword arguments of the service call, not fields.
+        fields = {k: v for k, v in payload.items() if k not in ("user_id", "db")}
+        return svc.update_run_fields(run_id, user_id=auth_key.user_id, db=db, **fields)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -135,6 +139,7 @@ def update_run_fields(
 def update_run_metadata(
     run_id: str,
     payload: Dict[str, Any] = Body(...),
+    db: Session = Depends(get_db),
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
     logging_utility.info("[%s] Updating metadata for run %s", auth_key.user_id, run_id)
@@ -147,19 +152,20 @@ def update_run_metadata(
     )
     svc = RunService()
     # user_id already forwarded in original — no change needed here.
-    return svc.update_run(run_id, metadata, user_id=auth_key.user_id)
+    return svc.update_run(run_id, metadata, user_id=auth_key.user_id, db=db)
 
 
 @router.post("/runs/{run_id}/cancel", response_model=ValidationInterface.Run)
 def cancel_run(
     run_id: str,
+    db: Session = Depends(get_db),
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
     logging_utility.info(f"[{auth_key.user_id}] Cancelling run {run_id}")
     run_service = RunService()
     try:
         cancelled_run = run_service.cancel_run(  # ← FIXED: user_id now forwarded
-            run_id, user_id=auth_key.user_id
+            run_id, user_id=auth_key.user_id, db=db
         )
         logging_utility.info(f"Run cancelled successfully: {run_id}")
         return cancelled_run
@@ -211,11 +217,27 @@ async def stream_run_events(
     return EventSourceResponse(event_generator())
 
 
+def _run_list_response(runs, has_more: bool) -> Response:
+    """
+    Serialize a runs page in one pydantic-core pass. The items were built from
+    trusted rows, so the envelope is constructed rather than validated.
+    """
+    page = ValidationInterface.RunListResponse.model_construct(
+        object="list",
+        data=runs,
+        first_id=runs[0].id if runs else None,
+        last_id=runs[-1].id if runs else None,
+        has_more=has_more,
+    )
+    return Response(content=page.model_dump_json(), media_type="application/json")
+
+
 @router.get("/runs", response_model=ValidationInterface.RunListResponse)
 def list_runs(
     limit: int = Query(20, ge=1, le=100),
     order: Literal["asc", "desc"] = Query("asc"),
     thread_id: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
     user_id = auth_key.user_id
@@ -229,15 +251,9 @@ def list_runs(
     svc = RunService()
     try:
         runs, has_more = svc.list_runs(
-            user_id=user_id, limit=limit, order=order, thread_id=thread_id
+            user_id=user_id, limit=limit, order=order, thread_id=thread_id, db=db
         )
-        return {
-            "object": "list",
-            "data": runs,
-            "first_id": runs[0].id if runs else None,
-            "last_id": runs[-1].id if runs else None,
-            "has_more": has_more,
-        }
+        return _run_list_response(runs, has_more)
     except HTTPException:
         raise
     except Exception as e:
@@ -259,6 +275,7 @@ def list_runs_for_thread(
     thread_id: str,
     limit: int = Query(20, ge=1, le=100),
     order: Literal["asc", "desc"] = Query("asc"),
+    db: Session = Depends(get_db),
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
     user_id = auth_key.user_id
@@ -272,14 +289,8 @@ def list_runs_for_thread(
     svc = RunService()
     try:
         runs, has_more = svc.list_runs(
-            user_id=user_id, limit=limit, order=order, thread_id=thread_id
+            user_id=user_id, limit=limit, order=order, thread_id=thread_id, db=db
         )
-        return {
-            "object": "list",
-            "data": runs,
-            "first_id": runs[0].id if runs else None,
-            "last_id": runs[-1].id if runs else None,
-            "has_more": has_more,
-        }
+        return _run_list_response(runs, has_more)
     except Exception as e:
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
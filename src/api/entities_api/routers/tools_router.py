@@ -1,7 +1,9 @@
 # src/api/entities_api/routers/tools_router.py
-from typing import List, Optional
+import asyncio
+from typing import Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -11,17 +13,41 @@ from src.api.entities_api.dependencies import (get_api_key, get_db,
                                                get_scratchpad_service,
                                                get_web_reader)
 from src.api.entities_api.models.models import ApiKey as ApiKeyModel
-from src.api.entities_api.models.models import User as UserModel
-from src.api.entities_api.orchestration.mixins.web_search_mixin import \
-    SearxNGClient
+from src.api.entities_api.orchestration.mixins.web_search_mixin import (
+    SearxNGClient, get_searxng_client)
 from src.api.entities_api.services.logging_service import LoggingUtility
 from src.api.entities_api.services.web_reader import UniversalWebReader
-from src.api.entities_api.utils.check_admin_status import _is_admin
+from src.api.entities_api.utils.check_admin_status import (
+    AdminIdentity, get_admin_identity)
 
 # --- Router Setup ---
 router = APIRouter()
 logging_utility = LoggingUtility()
 
+# SERP results are stable over short windows and agents repeat queries during
+# multi-step research. Concurrent identical misses share one in-flight task.
+SerpCacheKey = Tuple[str, int, Tuple[str, ...]]
+_SERP_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=120)
+_SERP_INFLIGHT: Dict[SerpCacheKey, asyncio.Task] = {}
+
+
+async def _fetch_serp(
+    searxng: SearxNGClient, key: SerpCacheKey, engines: Optional[List[str]]
+) -> str:
+    query, count, _ = key
+    result = await searxng.format_for_agent(query=query, count=count, engines=engines)
+    # Failures come back as "❌ ..." strings; only cache real results.
+    if not result.startswith("❌"):
+        _SERP_CACHE[key] = result
+    return result
+
+
+def _forget_serp(key: SerpCacheKey, task: asyncio.Task) -> None:
+    if _SERP_INFLIGHT.get(key) is task:
+        del _SERP_INFLIGHT[key]
+    if not task.cancelled():
+        task.exception()  # mark retrieved when every caller was cancelled
+
 
 # --- Request Models ---
 
@@ -61,22 +87,34 @@ class ScratchpadAppendRequest(BaseModel):
     note: str
 
 
+# --- Response Models ---
+
+
+class ToolContentResponse(BaseModel):
+    content: str
+
+
+class ScratchpadWriteResponse(BaseModel):
+    status: str
+    message: str
+
+
 # --- Helper ---
 
 
-def verify_admin_privileges(db: Session, auth_key: ApiKeyModel) -> UserModel:
+def verify_admin_privileges(db: Session, auth_key: ApiKeyModel) -> AdminIdentity:
     """
     Enforce admin-only access. Raises 403 if the authenticated user is not an admin.
-    Returns the admin UserModel on success.
+    Returns the cached admin identity (is_admin, email) on success.
     """
-    if not _is_admin(auth_key.user_id, db):
+    identity = get_admin_identity(auth_key.user_id, db)
+    if identity is None or not identity.is_admin:
         logging_utility.warning(f"Unauthorized web access attempt by user ID: {auth_key.user_id}")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required to use Web Tools.",
         )
-    # Return the user object for logging purposes
-    return db.query(UserModel).filter(UserModel.id == auth_key.user_id).first()
+    return identity
 
 
 # -----------------------------------------------------------------------------
@@ -84,7 +122,7 @@ def verify_admin_privileges(db: Session, auth_key: ApiKeyModel) -> UserModel:
 # -----------------------------------------------------------------------------
 
 
-@router.post("/tools/web/read", summary="Read a URL (Page 0)")
+@router.post("/tools/web/read", response_model=ToolContentResponse, summary="Read a URL (Page 0)")
 async def read_url(
     payload: WebReadRequest,
     reader: UniversalWebReader = Depends(get_web_reader),
@@ -99,13 +137,17 @@ async def read_url(
     logging_utility.info(f"Admin '{admin_user.email}' requesting to read URL: {payload.url}")
     try:
         result = await reader.read(payload.url, force_refresh=payload.force_refresh)
-        return {"content": result}
+        return ToolContentResponse(content=result)
     except Exception as e:
         logging_utility.error(f"Web read failed for {payload.url}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Web browsing failed: {str(e)}")
 
 
-@router.post("/tools/web/scroll", summary="Scroll to a specific page")
+@router.post(
+    "/tools/web/scroll",
+    response_model=ToolContentResponse,
+    summary="Scroll to a specific page",
+)
 async def scroll_url(
     payload: WebScrollRequest,
     reader: UniversalWebReader = Depends(get_web_reader),
@@ -122,13 +164,17 @@ async def scroll_url(
     )
     try:
         result = await reader.scroll(payload.url, payload.page)
-        return {"content": result}
+        return ToolContentResponse(content=result)
     except Exception as e:
         logging_utility.error(f"Web scroll failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Scrolling failed: {str(e)}")
 
 
-@router.post("/tools/web/search", summary="Search text inside a loaded URL")
+@router.post(
+    "/tools/web/search",
+    response_model=ToolContentResponse,
+    summary="Search text inside a loaded URL",
+)
 async def search_url(
     payload: WebSearchRequest,
     reader: UniversalWebReader = Depends(get_web_reader),
@@ -142,14 +188,20 @@ async def search_url(
     verify_admin_privileges(db, auth_key)
     try:
         result = await reader.search(payload.url, payload.query)
-        return {"content": result}
+        return ToolContentResponse(content=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/tools/web/serp", summary="Structured SERP search via SearxNG")
+@router.post(
+    "/tools/web/serp",
+    response_model=ToolContentResponse,
+    summary="Structured SERP search via SearxNG",
+)
 async def serp_search(
     payload: SerpSearchRequest,
+    response: Response,
+    searxng: SearxNGClient = Depends(get_searxng_client),
     db: Session = Depends(get_db),
     auth_key: ApiKeyModel = Depends(get_api_key),
 ):
@@ -162,14 +214,29 @@ async def serp_search(
         f"Admin '{admin_user.email}' SERP search: '{payload.query}' "
         f"engines={payload.engines or 'default'} count={payload.count}"
     )
+    key: SerpCacheKey = (
+        payload.query.strip(),
+        payload.count,
+        tuple(sorted(payload.engines or ())),
+    )
+    result = _SERP_CACHE.get(key)
+    if result is not None:
+        response.headers["X-Cache"] = "HIT"
+        return ToolContentResponse(content=result)
+
+    # Same pattern as UniversalWebReader: the fetch runs as its own task until
+    # it finishes, and every caller awaits it through shield(), so a
+    # disconnecting caller never cancels the fetch for the others.
+    task = _SERP_INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_serp(searxng, key, payload.engines))
+        _SERP_INFLIGHT[key] = task
+        task.add_done_callback(lambda t: _forget_serp(key, t))
+        response.headers["X-Cache"] = "MISS"
+    else:
+        response.headers["X-Cache"] = "HIT"
     try:
-        searxng = SearxNGClient()
-        result = await searxng.format_for_agent(
-            query=payload.query,
-            count=payload.count,
-            engines=payload.engines,
-        )
-        return {"content": result}
+        return ToolContentResponse(content=await asyncio.shield(task))
     except Exception as e:
         logging_utility.error(f"SERP search failed for '{payload.query}': {str(e)}")
         raise HTTPException(status_code=500, detail=f"SERP search failed: {str(e)}")
@@ -180,7 +247,11 @@ async def serp_search(
 # -----------------------------------------------------------------------------
 
 
-@router.post("/tools/scratchpad/read", summary="Read the current research plan/notes")
+@router.post(
+    "/tools/scratchpad/read",
+    response_model=ToolContentResponse,
+    summary="Read the current research plan/notes",
+)
 async def read_scratchpad(
     payload: ScratchpadReadRequest,
     service: ScratchpadService = Depends(get_scratchpad_service),
@@ -191,13 +262,17 @@ async def read_scratchpad(
     verify_admin_privileges(db, auth_key)
     try:
         content = await service.get_formatted_view(payload.thread_id)
-        return {"content": content}
+        return ToolContentResponse(content=content)
     except Exception as e:
         logging_utility.error(f"Scratchpad read failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/tools/scratchpad/update", summary="Overwrite the research plan")
+@router.post(
+    "/tools/scratchpad/update",
+    response_model=ScratchpadWriteResponse,
+    summary="Overwrite the research plan",
+)
 async def update_scratchpad(
     payload: ScratchpadUpdateRequest,
     service: ScratchpadService = Depends(get_scratchpad_service),
@@ -208,13 +283,17 @@ async def update_scratchpad(
     verify_admin_privileges(db, auth_key)
     try:
         msg = await service.update_content(payload.thread_id, payload.content)
-        return {"status": "success", "message": msg}
+        return ScratchpadWriteResponse(status="success", message=msg)
     except Exception as e:
         logging_utility.error(f"Scratchpad update failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/tools/scratchpad/append", summary="Add a note to the scratchpad")
+@router.post(
+    "/tools/scratchpad/append",
+    response_model=ScratchpadWriteResponse,
+    summary="Add a note to the scratchpad",
+)
 async def append_scratchpad(
     payload: ScratchpadAppendRequest,
     service: ScratchpadService = Depends(get_scratchpad_service),
@@ -225,7 +304,7 @@ async def append_scratchpad(
     verify_admin_privileges(db, auth_key)
     try:
         msg = await service.append_note(payload.thread_id, payload.note)
-        return {"status": "success", "message": msg}
+        return ScratchpadWriteResponse(status="success", message=msg)
     except Exception as e:
         logging_utility.error(f"Scratchpad append failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -9,6 +9,7 @@ from src.api.entities_api.models.models import ApiKey as ApiKeyModel
 from src.api.entities_api.models.models import User as UserModel
 from src.api.entities_api.serializers import UserUpdate
 from src.api.entities_api.services.user_service import UserService
+from src.api.entities_api.utils.check_admin_status import invalidate_admin_cache
 
 validation = ValidationInterface()
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -100,7 +101,10 @@ def update_user(
         del update_data["is_admin"]
     user_service = UserService()
     try:
-        return user_service.update_user(user_id, UserUpdate(**update_data))
+        updated = user_service.update_user(user_id, UserUpdate(**update_data))
+        if "is_admin" in update_data:
+            invalidate_admin_cache(user_id)
+        return updated
     except HTTPException:
         raise
     except Exception:
@@ -137,6 +141,7 @@ def delete_user(
         # erase_user() handles physical assets + messages + audit log
         # before delegating to DB cascades for the rest.
         user_service.erase_user(user_id)
+        invalidate_admin_cache(user_id)
         return None
     except HTTPException:
         raise
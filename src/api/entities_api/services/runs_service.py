@@ -1,14 +1,17 @@
 # src/api/entities_api/services/runs_service.py
 import json
 import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from fastapi import HTTPException
 from projectdavid_common import UtilsInterface, ValidationInterface
 from projectdavid_common.utilities.logging_service import LoggingUtility
 from projectdavid_common.validation import StatusEnum
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import JSON, and_, case, cast, func, update
+from sqlalchemy.orm import Session, load_only
 
 from src.api.entities_api.db.database import SessionLocal
 from src.api.entities_api.models.models import Assistant, Run
@@ -36,6 +39,75 @@ MUTABLE_RUN_FIELDS = {
 _VALID_TRUNCATION = {"auto", "disabled"}
 
 
+def _field_types(model: Any) -> Dict[str, TypeAdapter]:
+    """
+    Adapters for the read-model fields whose schema types differ from what the
+    ORM row holds (RunStatus vs the ORM StatusEnum, Tool models vs raw dicts,
+    TruncationStrategy vs str). Models built with model_construct skip
+    validation, so these values are converted explicitly in _read_fields.
+    """
+    return {
+        name: TypeAdapter(model.model_fields[name].annotation)
+        for name in ("status", "tools", "truncation_strategy")
+    }
+
+
+_RUN_FIELD_TYPES = _field_types(validator.Run)
+_RUN_DETAILED_FIELD_TYPES = _field_types(validator.RunReadDetailed)
+
+# Terminal statuses a run cannot be cancelled from.
+_FINISHED_STATUSES = frozenset({StatusEnum.completed, StatusEnum.cancelled})
+
+
+def _json_merge(column, patch: Dict[str, Any]):
+    """
+    Server-side shallow merge of `patch` into a JSON object column, with the
+    same semantics as dict.update: keys in `patch` overwrite, others are kept.
+    Like _ensure_dict, a JSON string holding an object is parsed and its keys
+    kept; NULL and any other value are treated as an empty object.
+    Renders as MySQL JSON_SET(...), so the merge is atomic within the UPDATE.
+    """
+    text = func.json_unquote(column)
+    base = case(
+        (func.json_type(column) == "OBJECT", column),
+        # JSON_VALID first: JSON_TYPE/CAST raise on text that is not JSON.
+        (
+            and_(func.json_type(column) == "STRING", func.json_valid(text) == 1),
+            case((func.json_type(text) == "OBJECT", cast(text, JSON)), else_=func.json_object()),
+        ),
+        else_=func.json_object(),
+    )
+    args: List[Any] = []
+    for key, value in patch.items():
+        escaped = str(key).replace("\\", "\\\\").replace('"', '\\"')
+        args.append(f'$."{escaped}"')
+        args.append(cast(value, JSON))
+    return func.json_set(base, *args)
+
+
+@contextmanager
+def _session(db: Optional[Session] = None) -> Iterator[Session]:
+    """
+    Use the caller's request-scoped session when one is passed in (routers
+    inject it via Depends(get_db)), otherwise open and close our own.
+
+    Sessions here serialize the row straight after commit, so keep the loaded
+    attributes instead of expiring them and paying a reload SELECT (or an
+    explicit db.refresh) for values we just wrote ourselves.
+    """
+    if db is None:
+        with SessionLocal(expire_on_commit=False) as own:
+            yield own
+        return
+
+    previous = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        yield db
+    finally:
+        db.expire_on_commit = previous
+
+
 class RunService:
     def __init__(self) -> None:
         self.logger = LoggingUtility()
@@ -72,51 +144,73 @@ class RunService:
                 return {}
         return {}
 
-    def _get_run_or_404(self, run_id: str, db: Session) -> Run:
-        run = db.query(Run).filter(Run.id == run_id).first()
+    def _get_run_or_404(self, run_id: str, db: Session, *, populate_existing: bool = False) -> Run:
+        # Primary-key lookup: served from the identity map when already loaded,
+        # unless populate_existing forces a reload (after a Core UPDATE).
+        run = db.get(Run, run_id, populate_existing=populate_existing)
         if not run:
             raise HTTPException(status_code=404, detail="Run not found")
         return run
 
-    def _to_read_model(self, r: Run) -> validator.Run:
-        """Standardized mapping to prevent 'missing field' errors in Pydantic."""
+    def _read_fields(
+        self, r: Run, types: Dict[str, TypeAdapter] = _RUN_FIELD_TYPES
+    ) -> Dict[str, Any]:
+        """
+        Standardized mapping to prevent 'missing field' errors in Pydantic.
+        Values carry the schema's types, so the result is safe for model_construct.
+        """
         # Coerce stale/malformed truncation_strategy values from old dev runs.
         # '{}', '', or any non-enum string → None (schema accepts Optional).
         raw_truncation = r.truncation_strategy
         if raw_truncation not in _VALID_TRUNCATION:  # ← module-level constant, no self.
             raw_truncation = None
 
-        return validator.Run(
-            id=r.id,
-            user_id=r.user_id,
-            assistant_id=r.assistant_id,
-            cancelled_at=self._to_epoch(r.cancelled_at),
-            completed_at=self._to_epoch(r.completed_at),
-            created_at=self._to_epoch(r.created_at),
-            expires_at=self._to_epoch(r.expires_at) or 0,
-            failed_at=self._to_epoch(r.failed_at),
-            incomplete_details=r.incomplete_details,
-            instructions=r.instructions or "",
-            last_error=r.last_error,
-            max_completion_tokens=r.max_completion_tokens,
-            max_prompt_tokens=r.max_prompt_tokens,
-            meta_data=self._ensure_dict(r.meta_data),
-            model=r.model or "",
-            object=r.object or "thread.run",
-            parallel_tool_calls=bool(r.parallel_tool_calls),
-            required_action=r.required_action,
-            response_format=r.response_format or "text",
-            started_at=self._to_epoch(r.started_at),
-            status=(r.status.value if hasattr(r.status, "value") else r.status),
-            thread_id=r.thread_id,
-            tool_choice=r.tool_choice or "none",
-            tools=(r.tools if r.tools is not None else []),
-            truncation_strategy=raw_truncation,
-            usage=r.usage or {},
-            temperature=r.temperature if r.temperature is not None else 0.7,
-            top_p=r.top_p if r.top_p is not None else 0.9,
-            tool_resources=self._ensure_dict(r.tool_resources),
-        )
+        # Run timestamps are Integer epoch columns, so they pass straight
+        # through; _to_epoch is only needed for loosely typed inputs.
+        ensure_dict = self._ensure_dict
+        return {
+            "id": r.id,
+            "user_id": r.user_id,
+            "assistant_id": r.assistant_id,
+            "cancelled_at": r.cancelled_at,
+            "completed_at": r.completed_at,
+            "created_at": r.created_at,
+            "expires_at": r.expires_at or 0,
+            "failed_at": r.failed_at,
+            "incomplete_details": r.incomplete_details,
+            "instructions": r.instructions or "",
+            "last_error": r.last_error,
+            "max_completion_tokens": r.max_completion_tokens,
+            "max_prompt_tokens": r.max_prompt_tokens,
+            "meta_data": ensure_dict(r.meta_data),
+            "model": r.model or "",
+            "object": r.object or "thread.run",
+            "parallel_tool_calls": bool(r.parallel_tool_calls),
+            "required_action": r.required_action,
+            "response_format": r.response_format or "text",
+            "started_at": r.started_at,
+            "status": types["status"].validate_python(getattr(r.status, "value", r.status)),
+            "thread_id": r.thread_id,
+            "tool_choice": r.tool_choice or "none",
+            "tools": types["tools"].validate_python(r.tools if r.tools is not None else []),
+            "truncation_strategy": types["truncation_strategy"].validate_python(raw_truncation),
+            "usage": r.usage or {},
+            "temperature": r.temperature if r.temperature is not None else 0.7,
+            "top_p": r.top_p if r.top_p is not None else 0.9,
+            "tool_resources": ensure_dict(r.tool_resources),
+        }
+
+    def _to_read_model(self, r: Run) -> validator.Run:
+        """Fully validated read model, for rows just written from caller input."""
+        return validator.Run(**self._read_fields(r))
+
+    def _to_read_model_unvalidated(self, r: Run) -> validator.Run:
+        """
+        Read model for rows loaded unchanged from the database. The row is the
+        source of truth and _read_fields already converts it to the schema's
+        types, so skip Pydantic validation.
+        """
+        return validator.Run.model_construct(**self._read_fields(r))
 
     # ──────────────────────────────────────────────────────────────────
     # Ownership guard
@@ -170,9 +264,34 @@ class RunService:
     # CRUD
     # ──────────────────────────────────────────────────────────────────
 
-    def create_run(self, run_data: validator.RunCreate, *, user_id: str) -> validator.Run:
-        with SessionLocal() as db:
-            assistant = db.query(Assistant).filter(Assistant.id == run_data.assistant_id).first()
+    def create_run(
+        self,
+        run_data: validator.RunCreate,
+        *,
+        user_id: str,
+        db: Optional[Session] = None,
+    ) -> validator.Run:
+        with _session(db) as db:
+            # Only the columns copied onto the run (plus owner_id for the access
+            # check) are loaded; `users` stays a lazy relationship.
+            assistant = (
+                db.query(Assistant)
+                .options(
+                    load_only(
+                        Assistant.owner_id,
+                        Assistant.model,
+                        Assistant.instructions,
+                        Assistant.tool_configs,
+                        Assistant.temperature,
+                        Assistant.top_p,
+                        Assistant.max_turns,
+                        Assistant.agent_mode,
+                        Assistant.tool_resources,
+                    )
+                )
+                .filter(Assistant.id == run_data.assistant_id)
+                .first()
+            )
             if not assistant:
                 raise HTTPException(status_code=404, detail="Assistant not found")
 
@@ -190,6 +309,7 @@ class RunService:
                     run_data.truncation_strategy, "value", run_data.truncation_strategy
                 )
 
+            now = int(time.time())
             new_run = Run(
                 id=UtilsInterface.IdentifierService.generate_run_id(),
                 user_id=user_id,
@@ -205,8 +325,8 @@ class RunService:
                 agent_mode=assistant.agent_mode,
                 meta_data=run_data.meta_data or {},
                 tool_resources=getattr(run_data, "tool_resources", assistant.tool_resources) or {},
-                created_at=int(time.time()),
-                expires_at=int(time.time() + 3600),
+                created_at=now,
+                expires_at=now + 3600,
                 object="thread.run",
                 parallel_tool_calls=getattr(run_data, "parallel_tool_calls", True),
                 response_format=getattr(run_data, "response_format", "text"),
@@ -215,7 +335,6 @@ class RunService:
 
             db.add(new_run)
             db.commit()
-            db.refresh(new_run)
             self.logger.info("Run created successfully: %s", new_run.id)
             return self._to_read_model(new_run)
 
@@ -224,6 +343,7 @@ class RunService:
         run_id: str,
         *,
         user_id: Optional[str] = None,
+        db: Optional[Session] = None,
     ) -> validator.RunReadDetailed:
         """
         Fetch a run by ID.
@@ -233,29 +353,30 @@ class RunService:
           - Omit it from internal orchestration callers (NativeExecutionService,
             OrchestratorCore) that need to poll any run regardless of ownership.
         """
-        with SessionLocal() as db:
+        with _session(db) as db:
             run = self._get_run_or_404(run_id, db)
 
             # ── Ownership check (user-facing calls only) ─────────────────────
             if user_id is not None:
                 self._assert_owner(run, user_id)
 
-            base_data = self._to_read_model(run).dict()
-            return validator.RunReadDetailed(**base_data, actions=[])
+            fields = self._read_fields(run, _RUN_DETAILED_FIELD_TYPES)
+            return validator.RunReadDetailed.model_construct(**fields, actions=[])
 
-    def update_run_status(self, run_id: str, new_status: str) -> validator.Run:
+    def update_run_status(
+        self, run_id: str, new_status: str, *, db: Optional[Session] = None
+    ) -> validator.Run:
         """
         Admin-only status override.
         Ownership is NOT checked here — the router gate already requires is_admin.
         """
-        with SessionLocal() as db:
+        with _session(db) as db:
             run = self._get_run_or_404(run_id, db)
             try:
                 run.status = StatusEnum(new_status)
             except ValueError:
                 raise HTTPException(status_code=400, detail=f"Invalid status: {new_status}")
             db.commit()
-            db.refresh(run)
             return self._to_read_model(run)
 
     def update_run_fields(
@@ -263,6 +384,7 @@ class RunService:
         run_id: str,
         *,
         user_id: Optional[str] = None,
+        db: Optional[Session] = None,
         **kwargs,
     ) -> validator.Run:
         """
@@ -288,26 +410,35 @@ class RunService:
                 run_id,
                 list(kwargs.keys()),
             )
-            return self.retrieve_run(run_id)
-
-        with SessionLocal() as db:
-            run = self._get_run_or_404(run_id, db)
-
+            return self.retrieve_run(run_id, db=db)
+
+        values: Dict[str, Any] = {}
+        for field, value in safe.items():
+            # Special case: meta_data always merges, never replaces
+            if field == "meta_data" and isinstance(value, dict):
+                if value:
+                    values[field] = _json_merge(Run.meta_data, value)
+            else:
+                values[field] = value
+
+        with _session(db) as db:
+            # Single UPDATE instead of SELECT + ORM flush; the meta_data merge
+            # happens in the database, so concurrent lifecycle writes can't
+            # clobber each other's keys.
+            stmt = update(Run).where(Run.id == run_id)
             # ── Ownership check (user-facing calls only) ─────────────────────
+            if user_id is not None:
+                stmt = stmt.where(Run.user_id == user_id)
+            if values:
+                db.execute(stmt.values(**values), execution_options={"synchronize_session": False})
+                db.commit()
+
+            # No RETURNING on MySQL: reload the row, which also tells a
+            # missing run (404) apart from one owned by someone else (403).
+            run = self._get_run_or_404(run_id, db, populate_existing=True)
             if user_id is not None:
                 self._assert_owner(run, user_id)
 
-            for field, value in safe.items():
-                # Special case: meta_data always merges, never replaces
-                if field == "meta_data" and isinstance(value, dict):
-                    current = self._ensure_dict(run.meta_data)
-                    current.update(value)
-                    run.meta_data = current
-                else:
-                    setattr(run, field, value)
-
-            db.commit()
-            db.refresh(run)
             self.logger.info("Run %s fields updated: %s", run_id, list(safe.keys()))
             return self._to_read_model(run)
 
@@ -318,8 +449,9 @@ class RunService:
         limit: int = 20,
         order: str = "asc",
         thread_id: Optional[str] = None,
+        db: Optional[Session] = None,
     ) -> Tuple[List[validator.Run], bool]:
-        with SessionLocal() as db:
+        with _session(db) as db:
             q = db.query(Run).filter(Run.user_id == user_id)
             if thread_id:
                 q = q.filter(Run.thread_id == thread_id)
@@ -330,23 +462,25 @@ class RunService:
             has_more = len(rows) > limit
             rows = rows[:limit]
 
-            return [self._to_read_model(r) for r in rows], has_more
+            to_model = self._to_read_model_unvalidated
+            return [to_model(r) for r in rows], has_more
 
-    def cancel_run(self, run_id: str, *, user_id: str) -> validator.Run:
-        with SessionLocal() as db:
+    def cancel_run(
+        self, run_id: str, *, user_id: str, db: Optional[Session] = None
+    ) -> validator.Run:
+        with _session(db) as db:
             run = self._get_run_or_404(run_id, db)
 
             # ── Ownership check ──────────────────────────────────────────────
             self._assert_owner(run, user_id)
 
-            if run.status in {StatusEnum.completed, StatusEnum.cancelled}:
+            if run.status in _FINISHED_STATUSES:
                 raise HTTPException(status_code=400, detail="Run is already finished")
 
             run.status = StatusEnum.cancelled
             run.cancelled_at = int(time.time())
 
             db.commit()
-            db.refresh(run)
             return self._to_read_model(run)
 
     def update_run(
@@ -355,19 +489,26 @@ class RunService:
         new_metadata: Dict[str, Any],
         *,
         user_id: Optional[str] = None,
+        db: Optional[Session] = None,
     ) -> validator.Run:
-        with SessionLocal() as db:
-            run = self._get_run_or_404(run_id, db)
+        patch = self._ensure_dict(new_metadata)
+
+        with _session(db) as db:
+            # Merge server-side in one UPDATE (see update_run_fields); only the
+            # patch travels to the database, and concurrent merges can't race.
+            stmt = update(Run).where(Run.id == run_id)
+            if user_id is not None:
+                stmt = stmt.where(Run.user_id == user_id)
+            if patch:
+                stmt = stmt.values(meta_data=_json_merge(Run.meta_data, patch))
+                db.execute(stmt, execution_options={"synchronize_session": False})
+                db.commit()
+
+            run = self._get_run_or_404(run_id, db, populate_existing=True)
 
             # ── Ownership check — 403 not 404 ────────────────────────────────
             # Previous version returned 404 on mismatch, which leaks existence.
             if user_id is not None:
                 self._assert_owner(run, user_id)
 
-            current = self._ensure_dict(run.meta_data)
-            current.update(self._ensure_dict(new_metadata))
-            run.meta_data = current
-
-            db.commit()
-            db.refresh(run)
             return self._to_read_model(run)
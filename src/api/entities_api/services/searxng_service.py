@@ -1,34 +1,69 @@
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from heapq import nlargest
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
+
+from src.api.entities_api.clients.loop_local_http import LoopLocalHttpClient
+from src.api.entities_api.orchestration.mixins.web_search_mixin import _authority_tag, _score
 
 logger = logging.getLogger("SearxNGService")
 
 SEARXNG_URL = "http://searxng:8080"
+SEARXNG_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30)
+
+# Bodies larger than this are decoded in a worker thread to keep the loop free.
+SEARXNG_THREAD_PARSE_BYTES = 64 * 1024
 
 
 class SearxNGResult:
+    __slots__ = ("title", "url", "snippet", "engine", "score")
+
     def __init__(self, data: Dict[str, Any]):
-        self.title: str = data.get("title", "No Title")
-        self.url: str = data.get("url", "")
-        self.snippet: str = data.get("content", "")
-        self.engine: str = data.get("engine", "unknown")
-        self.score: float = data.get("score", 0.0)
+        get = data.get
+        self.title: str = get("title", "No Title")
+        self.url: str = get("url", "")
+        self.snippet: str = get("content", "")
+        self.engine: str = get("engine", "unknown")
+        self.score: float = _score(data)
 
     def __repr__(self):
         return f"<SearxNGResult title={self.title!r} url={self.url!r}>"
 
 
+@lru_cache(maxsize=64)
+def _engines_param(engines: Tuple[str, ...]) -> str:
+    # Agents reuse a handful of engine lists; join each one once.
+    return ",".join(engines)
+
+
+def _format_result(i: int, r: SearxNGResult) -> str:
+    return (
+        f"{i}. **{r.title}**{_authority_tag(r.url)}  [via {r.engine}]\n"
+        f"   URL: {r.url}\n"
+        f"   {r.snippet}\n"
+    )
+
+
 class SearxNGService:
     """
     Thin async client for the internal SearxNG container.
     Returns clean structured results — no scraping, no markdown parsing.
+
+    HTTP connections are pooled per event loop via LoopLocalHttpClient.
     """
 
     def __init__(self, base_url: str = SEARXNG_URL, timeout: int = 15):
         self.base_url = base_url
         self.timeout = timeout
+        self._http = LoopLocalHttpClient(base_url=base_url, timeout=timeout, limits=SEARXNG_LIMITS)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client of the current loop."""
+        await self._http.aclose()
 
     async def search(
         self,
@@ -60,15 +95,19 @@ class SearxNGService:
         }
 
         if engines:
-            params["engines"] = ",".join(engines)
+            params["engines"] = _engines_param(tuple(engines))
 
         logger.info(f"🔎 SearxNG query: '{query}' | engines={engines or 'default'}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.get(f"{self.base_url}/search", params=params)
-                resp.raise_for_status()
-                data = resp.json()
+            http = await self._http.get()
+            resp = await http.get("/search", params=params)
+            resp.raise_for_status()
+            body = resp.content
+            if len(body) > SEARXNG_THREAD_PARSE_BYTES:
+                data = await asyncio.to_thread(orjson.loads, body)
+            else:
+                data = orjson.loads(body)
         except httpx.HTTPStatusError as e:
             logger.error(f"SearxNG HTTP error: {e}")
             raise RuntimeError(f"SearxNG returned {e.response.status_code}")
@@ -77,13 +116,13 @@ class SearxNGService:
             raise RuntimeError(f"Could not reach SearxNG: {e}")
 
         raw_results = data.get("results", [])
-        results = [SearxNGResult(r) for r in raw_results]
 
-        # Sort by score, best first
-        results.sort(key=lambda r: r.score, reverse=True)
+        # Partial-rank the raw dicts, best first, so only the kept results are
+        # wrapped. nlargest is stable, so ties keep SearxNG's order as before.
+        ranked = nlargest(count, raw_results, key=_score)
 
-        logger.info(f"✅ SearxNG returned {len(results)} results for '{query}'")
-        return results[:count]
+        logger.info(f"✅ SearxNG returned {len(raw_results)} results for '{query}'")
+        return [SearxNGResult(r) for r in ranked]
 
     async def format_for_agent(
         self,
@@ -103,23 +142,9 @@ class SearxNGService:
         if not results:
             return f"❌ No results found for '{query}'. Try a broader query."
 
-        lines = [f"🔍 SEARCH RESULTS for '{query}' ({len(results)} found):\n"]
-
-        for i, r in enumerate(results, 1):
-            authority_tag = ""
-            if any(d in r.url for d in [".gov", ".edu", ".org"]):
-                authority_tag = " [HIGH AUTHORITY]"
-            elif "wikipedia.org" in r.url:
-                authority_tag = " [ENCYCLOPEDIA]"
-
-            lines.append(
-                f"{i}. **{r.title}**{authority_tag}  [via {r.engine}]\n"
-                f"   URL: {r.url}\n"
-                f"   {r.snippet}\n"
-            )
-
-        lines.append(
-            "\n👉 NEXT STEP: Call read_web_page(url='...') on the most relevant results above."
+        body = "\n".join(_format_result(i, r) for i, r in enumerate(results, 1))
+        return (
+            f"🔍 SEARCH RESULTS for '{query}' ({len(results)} found):\n\n"
+            f"{body}\n\n"
+            "👉 NEXT STEP: Call read_web_page(url='...') on the most relevant results above."
         )
-
-        return "\n".join(lines)
@@ -1,8 +1,9 @@
 # src/api/entities_api/services/web_reader.py
+import asyncio
 import logging
 import os
 import re
-from typing import List
+from typing import Dict, List, Tuple
 
 import html2text
 from playwright.async_api import async_playwright
@@ -23,6 +24,10 @@ class UniversalWebReader:
     via WebSocket (CDP). This keeps the API container secure and lightweight.
     """
 
+    # Fetches currently running, shared across reader instances so concurrent
+    # reads of the same URL (on the same event loop) reuse one browserless call.
+    _inflight: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
+
     def __init__(self, cache_service: WebSessionCache):
         self.cache = cache_service
 
@@ -64,11 +69,38 @@ class UniversalWebReader:
                 logger.info(f"⚡ Cache Hit for {url}")
                 return await self.cache.get_page_view(url, 0)
 
-        # 2. Fetch Content (Strictly Remote)
+        # 2. Join an identical fetch that is already running
+        loop = asyncio.get_running_loop()
+        key = (loop, url)
+        task = self._inflight.get(key)
+        if task is not None and not force_refresh:
+            logger.info(f"⏳ Joining in-flight fetch for {url}")
+            return await asyncio.shield(task)
+
+        # The fetch runs as its own task and every caller (the one that started
+        # it included) awaits it through shield(), so a caller whose client
+        # disconnects is cancelled alone instead of cancelling the shared fetch.
+        task = asyncio.ensure_future(self._fetch_and_store(url))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._forget_inflight(key, t))
+        return await asyncio.shield(task)
+
+    @classmethod
+    def _forget_inflight(
+        cls, key: Tuple[asyncio.AbstractEventLoop, str], task: asyncio.Task
+    ) -> None:
+        if cls._inflight.get(key) is task:
+            del cls._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved when every caller was cancelled
+
+    async def _fetch_and_store(self, url: str) -> str:
+        """Fetch via browserless, chunk, persist to Redis and return Page 0."""
+        # Fetch Content (Strictly Remote)
         logger.info(f"🌐 Offloading fetch to Browser Service: {url}")
         content = await self._fetch_via_browserless(url)
 
-        # 3. Process & Chunk
+        # Process & Chunk
         clean_text = content.strip()
         if not clean_text or len(clean_text) < 50:
             # Fallback check for empty responses
@@ -76,12 +108,11 @@ class UniversalWebReader:
 
         chunks = self._chunk_text(clean_text)
 
-        # 4. Save to Redis
+        # Save to Redis
         await self.cache.save_session(
             url=url, full_text=clean_text, chunks=chunks, source="Remote Browserless"
         )
 
-        # 5. Return Page 0
         return await self.cache.get_page_view(url, 0)
 
     async def scroll(self, url: str, page: int) -> str:
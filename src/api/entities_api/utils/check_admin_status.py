@@ -1,10 +1,54 @@
 # src/api/entities_api/utils/check_admin_status.py
+import threading
+from typing import NamedTuple, Optional
+
+from cachetools import TTLCache
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.api.entities_api.models.models import User as UserModel
 
 
+class AdminIdentity(NamedTuple):
+    is_admin: bool
+    email: Optional[str]
+
+
+# Short-lived per-process cache of admin lookups for the high-frequency tool
+# endpoints. Role changes go through invalidate_admin_cache().
+_ADMIN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_ADMIN_CACHE_LOCK = threading.Lock()
+
+
 def _is_admin(user_id: str, db: Session) -> bool:
     """Return True if the user exists and has is_admin=True."""
     user = db.query(UserModel).filter(UserModel.id == user_id).first()
     return bool(user and user.is_admin)
+
+
+def get_admin_identity(user_id: str, db: Session) -> Optional[AdminIdentity]:
+    """
+    Return the (is_admin, email) pair for a user, served from a 30s TTL cache.
+    Returns None if the user does not exist.
+    """
+    with _ADMIN_CACHE_LOCK:
+        cached = _ADMIN_CACHE.get(user_id)
+    if cached is not None:
+        return cached
+
+    row = db.execute(
+        select(UserModel.is_admin, UserModel.email).where(UserModel.id == user_id)
+    ).one_or_none()
+    if row is None:
+        return None
+
+    identity = AdminIdentity(is_admin=bool(row.is_admin), email=row.email)
+    with _ADMIN_CACHE_LOCK:
+        _ADMIN_CACHE[user_id] = identity
+    return identity
+
+
+def invalidate_admin_cache(user_id: str) -> None:
+    """Drop any cached admin identity for the user (call after role changes)."""
+    with _ADMIN_CACHE_LOCK:
+        _ADMIN_CACHE.pop(user_id, None)
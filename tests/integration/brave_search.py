@@ -1,6 +1,10 @@
+import asyncio
 import os
+import sys
+from typing import Any, Dict, List
 
-import requests
+import httpx
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -12,7 +16,6 @@ if not API_KEY:
 url = "https://api.search.brave.com/res/v1/web/search"
 
 params = {
-    "q": "bgp route reflector design",
     "count": 10,
     "offset": 0,
     "safesearch": "off",
@@ -23,13 +26,40 @@ params = {
 
 headers = {"Accept": "application/json", "X-Subscription-Token": API_KEY}
 
-resp = requests.get(url, headers=headers, params=params, timeout=10)
-resp.raise_for_status()
+queries = ["bgp route reflector design"]
 
-results = resp.json()["web"]["results"]
+# Rate limits / transient 5xx responses are retried with backoff.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
 
-for i, r in enumerate(results):
-    print(f"{i+1}. {r['title']}")
-    print(f"   {r['url']}")
-    print(f"   {r.get('description')}")
-    print()
+
+async def search_one(client: httpx.AsyncClient, query: str) -> List[Dict[str, Any]]:
+    for attempt in range(MAX_RETRIES + 1):
+        resp = await client.get(url, params={**params, "q": query})
+        if resp.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            break
+        await asyncio.sleep(BACKOFF_FACTOR * (2**attempt))
+    resp.raise_for_status()
+    return orjson.loads(resp.content)["web"]["results"]
+
+
+async def search(queries: List[str]) -> List[List[Dict[str, Any]]]:
+    # One pooled client; the queries run concurrently over its connections.
+    async with httpx.AsyncClient(
+        headers=headers,
+        timeout=10,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=4),
+        transport=httpx.AsyncHTTPTransport(retries=MAX_RETRIES),
+    ) as client:
+        return await asyncio.gather(*(search_one(client, q) for q in queries))
+
+
+# Accumulate the report and write it once, instead of one print per line.
+chunks: List[str] = []
+for query, results in zip(queries, asyncio.run(search(queries))):
+    chunks.append(f"Query: {query}\n")
+    for i, r in enumerate(results):
+        chunks.append(f"{i+1}. {r['title']}\n   {r['url']}\n   {r.get('description')}\n")
+sys.stdout.write("\n".join(chunks) + "\n")
+sys.stdout.flush()
@@ -1,7 +1,7 @@
-import json
 import os
 import sys
 
+import orjson
 from dotenv import load_dotenv
 from projectdavid import Entity
 
@@ -15,6 +15,12 @@ client = Entity(
     api_key=os.getenv("ENTITIES_API_KEY"),
 )
 
+
+def dump(payload) -> str:
+    """Pretty-print a JSON response."""
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+
+
 # ------------------------------------------------------------------
 # 1. Define the Network Topology (The "Mental Map")
 # ------------------------------------------------------------------
@@ -57,7 +63,7 @@ def ingest():
             clear_existing=True,
         )
         print("\n✅ Inventory uploaded successfully.")
-        print(json.dumps(response, indent=2))
+        print(dump(response))
     except Exception as e:
         print(f"\n❌ Failed to ingest inventory: {e}")
 
@@ -71,7 +77,7 @@ def lookup_device(hostname: str):
         result = client.engineer.get_device_info(hostname=hostname)
         if result:
             print("✅ Device found:")
-            print(json.dumps(result, indent=2))
+            print(dump(result))
         else:
             print(f"⚠️  No device found with hostname '{hostname}'.")
     except Exception as e:
@@ -87,7 +93,7 @@ def lookup_group(group: str):
         results = client.engineer.search_inventory_by_group(group=group)
         if results:
             print(f"✅ Found {len(results)} device(s) in group '{group}':")
-            print(json.dumps(results, indent=2))
+            print(dump(results))
         else:
             print(f"⚠️  No devices found in group '{group}'.")
     except Exception as e: